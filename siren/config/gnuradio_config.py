@@ -9,6 +9,7 @@ This enables the working transmission method based on ais-simulator.py.
 
 import os
 import logging
+import importlib.util
 from typing import Dict, Any, Optional
 
 # GNU Radio AIS Configuration
@@ -69,54 +70,29 @@ def get_gnuradio_config() -> Dict[str, Any]:
     """Get GNU Radio configuration settings"""
     return GNURADIO_CONFIG.copy()
 
-def check_gnuradio_dependencies() -> Dict[str, bool]:
-    """Check if GNU Radio dependencies are available"""
-    dependencies = {
-        'gnuradio': False,
-        'gr_ais': False,
-        'osmosdr': False,
-        'websocket_client': False
-    }
-    
-    # Check GNU Radio
-    try:
-        from gnuradio import gr, blocks, digital, pdu
-        dependencies['gnuradio'] = True
-    except ImportError:
-        pass
-    
-    # Check gr-ais
-    try:
-        from gnuradio import ais_simulator
-        dependencies['gr_ais'] = True
-    except ImportError:
-        # Try alternative import
-        try:
-            from gnuradio import ais
-            dependencies['gr_ais'] = True
-        except ImportError:
-            pass
-    
-    # Check osmosdr
+def _module_available(name: str) -> bool:
+    """Check whether a module can be imported without executing it"""
     try:
-        import osmosdr
-        dependencies['osmosdr'] = True
-    except ImportError:
-        pass
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        # Raised when a parent package of a dotted name is missing
+        return False
+
+def check_gnuradio_dependencies() -> Dict[str, bool]:
+    """Check if GNU Radio dependencies are available
     
-    # Check websocket client
-    try:
-        import websocket
-        dependencies['websocket_client'] = True
-    except ImportError:
-        # Try alternative import name
-        try:
-            import websocket_client
-            dependencies['websocket_client'] = True
-        except ImportError:
-            pass
-    
-    return dependencies
+    Uses importlib.util.find_spec so the (slow) GNU Radio packages are only
+    located, not imported.
+    """
+    return {
+        'gnuradio': all(_module_available(f'gnuradio.{name}')
+                        for name in ('gr', 'blocks', 'digital', 'pdu')),
+        'gr_ais': (_module_available('gnuradio.ais_simulator') or
+                   _module_available('gnuradio.ais')),
+        'osmosdr': _module_available('osmosdr'),
+        'websocket_client': (_module_available('websocket') or
+                             _module_available('websocket_client'))
+    }
 
 def get_installation_instructions() -> str:
     """Get installation instructions for GNU Radio"""
@@ -5,11 +5,16 @@ Handles AIS message encoding using pyais library for standards compliance.
 Provides a clean interface for SIREN to generate AIS messages.
 """
 
+import functools
+import logging
+import operator
 import numpy as np
 from pyais.messages import MessageType1, MessageType2, MessageType3, MessageType4, MessageType5, MessageType18, MessageType21
 from pyais.encode import encode_msg
 from pyais import decode
 
+logger = logging.getLogger(__name__)
+
 def sixbit_to_char(val):
     """Convert 6-bit value to AIS ASCII character"""
     if val < 0 or val > 63:
@@ -31,10 +36,17 @@ def char_to_sixbit(char):
             (val >> 2) & 1, (val >> 1) & 1, val & 1]
 
 def compute_checksum(sentence):
-    """Compute NMEA checksum (XOR of all characters)"""
-    cs = 0
-    for c in sentence:
-        cs ^= ord(c)
+    """Compute NMEA checksum (XOR of all characters)
+    
+    XORs the character code points, so non-ASCII input still gets a
+    checksum rather than raising.
+    """
+    try:
+        # latin-1 bytes equal ord() for every code point up to 255
+        codes = sentence.encode('latin-1')
+    except UnicodeEncodeError:
+        codes = map(ord, sentence)
+    cs = functools.reduce(operator.xor, codes, 0)
     return f"{cs:02X}"
 
 def build_ais_payload(fields):
@@ -246,46 +258,86 @@ def build_aid_to_navigation_report_pyais(fields):
     
     return payload, fill
 
-# Keep legacy functions for compatibility and bit-level operations
-def sixbit_to_char(val):
-    """Convert 6-bit value to AIS ASCII character"""
-    if val < 0 or val > 63:
-        raise ValueError("6-bit value out of range")
-    return chr(val + 48 if val < 40 else val + 56)
-
-def char_to_sixbit(char):
-    """Convert AIS 6-bit ASCII character to bits"""
-    val = ord(char)
-    if val >= 48 and val < 88:
-        val -= 48
-    elif val >= 96 and val < 128:
-        val -= 56
-    else:
-        raise ValueError(f"Invalid AIS character: {char}")
-    
-    # Convert to 6 bits
-    return [(val >> 5) & 1, (val >> 4) & 1, (val >> 3) & 1, 
-            (val >> 2) & 1, (val >> 1) & 1, val & 1]
+# Bit-level operations
+def _build_crc16_table(poly):
+    """Byte-at-a-time lookup table for an MSB-first CRC-16"""
+    table = []
+    for byte in range(256):
+        crc = byte << 8
+        for _ in range(8):
+            crc = (crc << 1) ^ poly if crc & 0x8000 else crc << 1
+        table.append(crc & 0xFFFF)
+    return table
 
-def compute_checksum(sentence):
-    """Compute NMEA checksum (XOR of all characters)"""
-    cs = 0
-    for c in sentence:
-        cs ^= ord(c)
-    return f"{cs:02X}"
+_CRC16_TABLE = _build_crc16_table(0x1021)
 
 def calculate_crc(bits):
-    """Calculate CRC-16-CCITT for AIS message correctly at bit level"""
+    """Calculate CRC-16-CCITT for AIS message correctly at bit level
+    
+    Whole bytes go through a lookup table; a trailing partial byte (6-bit
+    payloads are not always byte aligned) is shifted in one bit at a time.
+    """
     poly = 0x1021
     crc = 0xFFFF
     
-    for bit in bits:
-        # Correctly process one bit at a time
+    bits = np.asarray(bits, dtype=np.uint8)
+    whole = len(bits) - len(bits) % 8
+    
+    for byte in np.packbits(bits[:whole]).tolist():
+        crc = ((crc << 8) & 0xFFFF) ^ _CRC16_TABLE[(crc >> 8) ^ byte]
+    
+    for bit in bits[whole:].tolist():
         crc ^= (bit << 15)
         crc = (crc << 1) ^ poly if crc & 0x8000 else crc << 1
         crc &= 0xFFFF
     
-    return [(crc >> i) & 1 for i in range(15, -1, -1)]
+    return np.unpackbits(np.array([crc >> 8, crc & 0xFF], dtype=np.uint8))
+
+def calculate_crc_batch(bits):
+    """CRC-16-CCITT of every row of a 2-D bit array, one table step per byte column
+    
+    Returns a (rows, 16) uint8 array, MSB first, matching calculate_crc per row.
+    """
+    poly = 0x1021
+    bits = np.asarray(bits, dtype=np.uint8)
+    whole = bits.shape[1] - bits.shape[1] % 8
+    table = np.array(_CRC16_TABLE, dtype=np.uint16)
+    crc = np.full(len(bits), 0xFFFF, dtype=np.uint16)
+    
+    for column in np.packbits(bits[:, :whole], axis=1).T:
+        crc = (crc << 8) ^ table[(crc >> 8) ^ column]
+    
+    for column in bits[:, whole:].T.astype(np.uint16):
+        crc ^= column << 15
+        crc = np.where(crc & 0x8000, (crc << 1) ^ poly, crc << 1).astype(np.uint16)
+    
+    # Big-endian bytes -> 16 bits per row
+    return np.unpackbits(crc.astype('>u2').view(np.uint8).reshape(-1, 2), axis=1)
+
+def hdlc_bit_stuff(bits):
+    """HDLC bit stuffing: insert a 0 after every five consecutive 1s
+    
+    Returns a uint8 array.
+    """
+    bits = np.asarray(bits, dtype=np.uint8)
+    
+    # Position of each 1 within its run of ones (1-based); the counter
+    # restarts after a stuffed zero, so stuff after every 5th one in a run
+    index = np.arange(len(bits))
+    last_zero = np.maximum.accumulate(np.where(bits == 0, index, -1))
+    run_length = index - last_zero
+    stuff_after = np.flatnonzero((bits == 1) & (run_length % 5 == 0))
+    
+    return np.insert(bits, stuff_after + 1, 0)
+
+def nrzi_encode(bits, initial_level=1):
+    """NRZI encode bits: transition on 0, hold on 1
+    
+    Computed as a running XOR over the inverted bits so there is no
+    per-bit branch. A 2-D array is encoded row by row. Returns a uint8 array.
+    """
+    zeros = 1 - np.asarray(bits, dtype=np.uint8)
+    return np.bitwise_xor.accumulate(zeros, axis=-1) ^ np.uint8(initial_level)
 
 def create_nmea_sentence(fields, channel='A'):
     """Create complete NMEA sentence from AIS fields using pyais"""
@@ -311,6 +363,17 @@ def validate_ais_message(nmea_sentence):
     except Exception as e:
         return False, str(e)
 
+# Precomputed 6-bit strings for every valid AIS payload character
+_SIXBIT_BITSTRINGS = {
+    chr(val): ''.join(str(bit) for bit in char_to_sixbit(chr(val)))
+    for val in (*range(48, 88), *range(96, 128))
+}
+
+# ASCII byte -> 6-bit value for every payload character; 0xFF marks invalid bytes
+_SIXBIT_LUT = np.full(256, 0xFF, dtype=np.uint8)
+_SIXBIT_LUT[48:88] = np.arange(0, 40)
+_SIXBIT_LUT[96:128] = np.arange(40, 72)
+
 def payload_to_bitstring(payload):
     """Convert AIS 6-bit ASCII payload to binary bit string for GNU Radio
     
@@ -326,19 +389,37 @@ def payload_to_bitstring(payload):
     if not payload:
         return ""
     
-    bit_string = ""
+    chunks = []
     for char in payload:
-        try:
-            # Convert each 6-bit ASCII character to 6 bits
-            bits = char_to_sixbit(char)
-            # Convert bit array to string
-            bit_string += ''.join(str(bit) for bit in bits)
-        except ValueError as e:
-            print(f"Warning: Invalid AIS character '{char}' in payload: {e}")
+        # Look up each 6-bit ASCII character's bit string
+        chunk = _SIXBIT_BITSTRINGS.get(char)
+        if chunk is None:
             # Skip invalid characters
+            logger.warning("Skipping invalid AIS character %r in payload", char)
             continue
+        chunks.append(chunk)
+    
+    return ''.join(chunks)
+
+def payload_to_bits(payload):
+    """Convert AIS 6-bit ASCII payload to a flat uint8 bit array (MSB first)
+    
+    Vectorized equivalent of concatenating char_to_sixbit() for every
+    character. Raises ValueError on the first invalid character.
+    """
+    try:
+        chars = np.frombuffer(payload.encode('ascii'), dtype=np.uint8)
+    except UnicodeEncodeError:
+        bad = next(c for c in payload if ord(c) > 127)
+        raise ValueError(f"Invalid AIS character: {bad}")
+    
+    sixbit = _SIXBIT_LUT[chars]
+    invalid = np.flatnonzero(sixbit == 0xFF)
+    if len(invalid):
+        raise ValueError(f"Invalid AIS character: {payload[invalid[0]]}")
     
-    return bit_string
+    bits = (sixbit[:, None] >> np.arange(5, -1, -1, dtype=np.uint8)) & 1
+    return bits.ravel()
 
 def extract_payload_from_nmea(nmea_sentence):
     """Extract AIS payload from NMEA sentence
@@ -5,8 +5,12 @@ Handles GMSK modulation, signal generation, and RF signal creation.
 Contains all signal processing functions from the original implementation.
 """
 
+import functools
+import logging
 import numpy as np
-from ..protocol.ais_encoding import char_to_sixbit, calculate_crc
+from ..protocol.ais_encoding import payload_to_bits, calculate_crc, hdlc_bit_stuff, nrzi_encode
+
+logger = logging.getLogger(__name__)
 
 # Signal configuration presets
 SIGNAL_PRESETS = [
@@ -14,6 +18,10 @@ SIGNAL_PRESETS = [
     {"name": "AIS Channel B", "freq": 162.025e6, "gain": 65, "modulation": "GMSK", "sdr_type": "hackrf"},
 ]
 
+# Frame constants shared by every burst
+HDLC_FLAG = np.array([0, 1, 1, 1, 1, 1, 1, 0], dtype=np.uint8)
+TRAINING_SEQUENCE = np.array([0, 1] * 8, dtype=np.uint8)
+
 def create_ais_signal(nmea_sentence, sample_rate=2e6, repetitions=6):
     """Create a properly modulated AIS signal from NMEA sentence"""
     # Extract payload from NMEA sentence
@@ -22,102 +30,106 @@ def create_ais_signal(nmea_sentence, sample_rate=2e6, repetitions=6):
         raise ValueError("Invalid NMEA sentence")
     
     payload = parts[5]
-    print(f"Creating AIS signal from payload: {payload}")
+    logger.debug("Creating AIS signal from payload: %s", payload)
     
+    # Repeat the signal
+    return np.tile(_modulate_payload(payload, sample_rate), repetitions)
+
+@functools.lru_cache(maxsize=8)
+def _modulate_payload(payload, sample_rate):
+    """Build one GMSK burst for an AIS payload
+    
+    Cached because the same sentence is often resent. Each burst is a few
+    hundred KB at 2 MS/s, so only the last few are kept. The returned array
+    is read-only and shared, so callers must copy before modifying it.
+    """
     # Convert 6-bit ASCII to bits
-    bits = []
-    for char in payload:
-        char_bits = char_to_sixbit(char)
-        bits.extend(char_bits)
+    bits = payload_to_bits(payload)
     
     # Calculate and append CRC
     crc_bits = calculate_crc(bits)
-    bits.extend(crc_bits)
-    print(f"Added CRC bits: {crc_bits}")
+    bits = np.concatenate([bits, crc_bits])
+    logger.debug("Added CRC bits: %s", crc_bits)
     
     # Create HDLC frame with flags and bit stuffing
-    start_flag = [0, 1, 1, 1, 1, 1, 1, 0]
-    stuffed_bits = []
-    consecutive_ones = 0
-    
-    # Start flag
-    stuffed_bits.extend(start_flag)
-    
-    # Training sequence
-    stuffed_bits.extend([0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1, 0, 1])
-    
-    # Log bit stuffing process
-    print(f"Original bits length: {len(bits)}")
-    
-    # Add data bits with bit stuffing
-    for i, bit in enumerate(bits):
-        if bit == 1:
-            consecutive_ones += 1
-        else:
-            consecutive_ones = 0
-            
-        stuffed_bits.append(bit)
-        
-        # After 5 consecutive ones, insert a 0
-        if consecutive_ones == 5:
-            stuffed_bits.append(0)
-            consecutive_ones = 0
-            print(f"Bit stuffing: Added zero after position {i}")
-    
-    # End flag
-    stuffed_bits.extend(start_flag)
-    
-    print(f"After bit stuffing: length={len(stuffed_bits)}")
+    logger.debug("Original bits length: %d", len(bits))
+    
+    # Start flag, training sequence, stuffed data bits, end flag
+    data_bits = hdlc_bit_stuff(bits)
+    stuffed_bits = np.concatenate([HDLC_FLAG, TRAINING_SEQUENCE, data_bits, HDLC_FLAG])
+    logger.debug("Bit stuffing: added %d zeros", len(data_bits) - len(bits))
+    
+    logger.debug("After bit stuffing: length=%d", len(stuffed_bits))
     
     # NRZI encoding
-    nrzi_bits = []
     # Initialize with last bit of training sequence for better sync
-    current_level = stuffed_bits[24] if len(stuffed_bits) > 24 else 0
-    
-    for bit in stuffed_bits:
-        if bit == 0:
-            current_level = 1 - current_level
-        nrzi_bits.append(current_level)
+    initial_level = stuffed_bits[24] if len(stuffed_bits) > 24 else 0
+    nrzi_bits = nrzi_encode(stuffed_bits, initial_level)
     
     # GMSK modulation
     bit_rate = 9600.0  # AIS bit rate
     samples_per_bit = int(sample_rate / bit_rate)
-    num_samples = len(nrzi_bits) * samples_per_bit
     
-    # Create Gaussian filter with proper BT product
-    bt = 0.4  # AIS BT product (standard value)
-    filter_length = 4
-    t = np.arange(-filter_length/2, filter_length/2, 1/samples_per_bit)
-    h = np.sqrt(2*np.pi/np.log(2)) * bt * np.exp(-2*np.pi**2*bt**2*t**2/np.log(2))
-    h = h / np.sum(h)
-    
-    # Upsample bits
-    upsampled = np.zeros(num_samples)
-    for i, bit in enumerate(nrzi_bits):
-        upsampled[i*samples_per_bit] = 2*bit - 1
+    h = _gaussian_taps(samples_per_bit)
     
-    # Apply Gaussian filter
-    filtered = np.convolve(upsampled, h, 'same')
+    # Apply Gaussian filter to the upsampled bits
+    symbols = 2 * nrzi_bits.astype(np.float32) - 1
+    filtered = _filter_impulse_train(symbols, h, samples_per_bit)
     
-    # MSK modulation
-    phase = np.cumsum(filtered) * np.pi / samples_per_bit
+    # MSK modulation (accumulate in float64 so the phase does not drift)
+    phase = np.cumsum(filtered, dtype=np.float64)
+    phase *= np.pi / samples_per_bit
     
-    # Generate I/Q samples
-    i_samples = np.cos(phase)
-    q_samples = np.sin(phase)
-    iq_samples = i_samples + 1j * q_samples
+    # Add pre-emphasis for better reception: rotating by exp(-j*pi/4) is a
+    # constant phase offset, so apply it before the trig instead of after
+    phase -= np.pi * 0.25
     
-    # Add pre-emphasis for better reception
-    emphasis = np.exp(-1j * np.pi * 0.25)
-    iq_samples *= emphasis
+    # Generate I/Q samples as complex64 (CF32, what the TX stream expects)
+    phase = phase.astype(np.float32)
+    iq_samples = np.empty(len(phase), dtype=np.complex64)
+    np.cos(phase, out=iq_samples.real)
+    np.sin(phase, out=iq_samples.imag)
     
-    # Normalize and scale
-    max_amp = np.max(np.abs(iq_samples))
-    if max_amp > 0:
-        iq_samples = iq_samples / max_amp * 0.9
+    # Scale to 0.9; samples are already unit magnitude, so no peak search
+    iq_samples *= np.float32(0.9)
     
-    # Repeat the signal
-    return np.tile(iq_samples * 1.0, repetitions)
+    iq_samples.setflags(write=False)
+    return iq_samples
+
+@functools.lru_cache(maxsize=None)
+def _gaussian_taps(samples_per_bit):
+    """Gaussian pulse shaping filter with proper BT product, normalized to unit sum"""
+    bt = 0.4  # AIS BT product (standard value)
+    filter_length = 4
+    t = np.arange(-filter_length/2, filter_length/2, 1/samples_per_bit)
+    h = np.sqrt(2*np.pi/np.log(2)) * bt * np.exp(-2*np.pi**2*bt**2*t**2/np.log(2))
+    h = (h / np.sum(h)).astype(np.float32)
+    h.setflags(write=False)
+    return h
+
+def _filter_impulse_train(symbols, h, samples_per_bit):
+    """Convolve symbols upsampled by zero insertion with h ('same' mode)
+    
+    Equivalent to np.convolve(upsampled, h, 'same'), but only the nonzero
+    samples are multiplied: each block of samples_per_bit filter taps is
+    scaled by every symbol and added at that symbol's offset, so the cost is
+    O(len(upsampled) * len(h) / samples_per_bit) instead of
+    O(len(upsampled) * len(h)).
+    """
+    num_samples = len(symbols) * samples_per_bit
+    blocks = -(-len(h) // samples_per_bit)
+    taps = np.zeros(blocks * samples_per_bit, dtype=np.float32)
+    taps[:len(h)] = h
+    taps = taps.reshape(blocks, samples_per_bit)
+    
+    full = np.zeros((len(symbols) + blocks, samples_per_bit), dtype=np.float32)
+    scratch = np.empty((len(symbols), samples_per_bit), dtype=np.float32)
+    for j in range(blocks):
+        np.multiply(symbols[:, None], taps[j], out=scratch)
+        full[j:j + len(symbols)] += scratch
+    
+    start = (len(h) - 1) // 2
+    return full.ravel()[start:start + num_samples]
 
 def get_signal_presets():
     """Get available signal presets"""
@@ -6,11 +6,14 @@ ship movement and AIS transmission.
 """
 
 import time
+import logging
 import threading
 from datetime import datetime
 from ..protocol.ais_encoding import build_ais_payload, compute_checksum
 from ..transmission.sdr_controller import TransmissionController
 
+logger = logging.getLogger(__name__)
+
 class SimulationController:
     """Controls the ship simulation and AIS transmission"""
     
@@ -31,9 +34,9 @@ class SimulationController:
             try:
                 from ..transmission.siren_gnuradio_integration import SIRENGnuRadioTransmitter
                 self.gnuradio_controller = SIRENGnuRadioTransmitter(use_gnuradio=True)
-                print(f"Initialized GNU Radio transmission controller")
+                logger.info("Initialized GNU Radio transmission controller")
             except Exception as e:
-                print(f"Failed to initialize GNU Radio controller: {e}")
+                logger.warning("Failed to initialize GNU Radio controller: %s", e)
                 # Fallback to SoapySDR
                 self.transmission_method = "SoapySDR"
                 self.transmission_controller = TransmissionController()
@@ -95,12 +98,12 @@ class SimulationController:
             from ..map.visualization import update_ships_on_map
             update_ships_on_map(selected_ship_indices)
         except Exception as e:
-            print(f"Error updating map: {e}")
+            logger.error("Error updating map: %s", e)
     
     def _run_simulation(self, signal_preset, interval, update_status_callback, selected_ship_indices=None):
         """Run AIS ship simulation"""
         def update_status(msg):
-            print(msg)
+            logger.info("%s", msg)
             if update_status_callback:
                 update_status_callback(msg)
         
@@ -161,7 +164,9 @@ class SimulationController:
                     else:
                         # Use SoapySDR controller
                         if self.transmission_controller:
-                            self.transmission_controller.transmit_signal(signal_preset, full_sentence, update_status)
+                            # transmit_signal logs its own status; only forward to the UI
+                            self.transmission_controller.transmit_signal(signal_preset, full_sentence,
+                                                                         update_status_callback)
                     
                     # Delay between ships
                     time.sleep(0.5)
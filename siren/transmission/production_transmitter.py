@@ -17,6 +17,8 @@ Based on hybrid_maritime_ais implementation
 import time
 import threading
 import logging
+import collections
+import concurrent.futures
 import numpy as np
 from typing import Optional, Dict, List, Tuple, Callable
 from dataclasses import dataclass
@@ -32,6 +34,8 @@ except ImportError:
 
 # Import SIREN components
 from ..ships.ais_ship import AISShip
+from ..protocol.ais_encoding import calculate_crc, calculate_crc_batch, hdlc_bit_stuff, nrzi_encode
+from .sdr_controller import write_stream_samples
 
 class OperationMode(Enum):
     """Operation modes for different transmission environments"""
@@ -53,67 +57,72 @@ class TransmissionConfig:
 class ProductionAISProtocol:
     """Production-ready AIS protocol with full ITU-R M.1371-5 compliance"""
     
+    # Protocol tables are built once at import and shared by every instance
+    NAV_STATUS_MAP = {
+        "Under way using engine": 0,
+        "At anchor": 1,
+        "Not under command": 2,
+        "Restricted manoeuverability": 3,
+        "Constrained by her draught": 4,
+        "Moored": 5,
+        "Aground": 6,
+        "Engaged in fishing": 7,
+        "Under way sailing": 8,
+        "Not defined": 15
+    }
+    TRAINING_SEQUENCE = np.array([0, 1] * 12, dtype=np.uint8)            # Training sequence (24 bits)
+    HDLC_FLAG = np.array([0, 1, 1, 1, 1, 1, 1, 0], dtype=np.uint8)       # HDLC start/end flag
+    BUFFER_BITS = np.zeros(8, dtype=np.uint8)                            # Buffer
+    
     def __init__(self, mode: OperationMode = OperationMode.PRODUCTION):
         self.mode = mode
         self.logger = logging.getLogger(__name__)
         
-    def create_position_message_bits(self, ship: AISShip) -> List[int]:
-        """Create AIS position report message bits from ship object"""
-        bits = []
+    def create_position_message_bits(self, ship: AISShip) -> np.ndarray:
+        """Create AIS position report message bits from ship object as a uint8 bit array"""
+        fields = []  # (value, width) pairs, MSB first
         
         # Message Type (6 bits) - Type 1 Position Report
-        bits.extend(self._int_to_bits(1, 6))
+        fields.append((1, 6))
         
         # Repeat Indicator (2 bits) - always 0 for original transmission
-        bits.extend(self._int_to_bits(0, 2))
+        fields.append((0, 2))
         
         # MMSI (30 bits)
-        bits.extend(self._int_to_bits(ship.mmsi, 30))
+        fields.append((ship.mmsi, 30))
         
         # Navigation Status (4 bits)
-        nav_status_map = {
-            "Under way using engine": 0,
-            "At anchor": 1,
-            "Not under command": 2,
-            "Restricted manoeuverability": 3,
-            "Constrained by her draught": 4,
-            "Moored": 5,
-            "Aground": 6,
-            "Engaged in fishing": 7,
-            "Under way sailing": 8,
-            "Not defined": 15
-        }
-        nav_status = nav_status_map.get(ship.status, ship.status if isinstance(ship.status, int) else 0)
-        bits.extend(self._int_to_bits(nav_status, 4))
+        nav_status = self.NAV_STATUS_MAP.get(ship.status, ship.status if isinstance(ship.status, int) else 0)
+        fields.append((nav_status, 4))
         
         # Rate of Turn (8 bits) - use ship.turn or default
         rot = getattr(ship, 'turn', 128)  # 128 = not available
         if rot == -128:
             rot = 128  # Convert invalid to not available
-        bits.extend(self._int_to_bits(rot & 0xFF, 8))
+        fields.append((rot & 0xFF, 8))
         
         # Speed over Ground (10 bits) - in 0.1 knot resolution
         sog_encoded = min(int(ship.speed * 10), 1022)
-        bits.extend(self._int_to_bits(sog_encoded, 10))
+        fields.append((sog_encoded, 10))
         
         # Position Accuracy (1 bit) - 0 = low accuracy (>10m)
-        bits.extend(self._int_to_bits(0, 1))
+        fields.append((0, 1))
         
         # Longitude (28 bits) - in 1/10000 minute resolution
         lon_encoded = int(ship.lon * 600000)
         if lon_encoded < 0:
             lon_encoded = (1 << 28) + lon_encoded  # Two's complement
-        bits.extend(self._int_to_bits(lon_encoded & ((1 << 28) - 1), 28))
+        fields.append((lon_encoded & ((1 << 28) - 1), 28))
         
         # Latitude (27 bits) - in 1/10000 minute resolution
         lat_encoded = int(ship.lat * 600000)
         if lat_encoded < 0:
             lat_encoded = (1 << 27) + lat_encoded  # Two's complement
-        bits.extend(self._int_to_bits(lat_encoded & ((1 << 27) - 1), 27))
+        fields.append((lat_encoded & ((1 << 27) - 1), 27))
         
         # Course over Ground (12 bits) - in 0.1 degree resolution
         cog_encoded = int(ship.course * 10) if ship.course != 360.0 else 3600
-        bits.extend(self._int_to_bits(cog_encoded & 0xFFF, 12))
+        fields.append((cog_encoded & 0xFFF, 12))
         
         # True Heading (9 bits)
         heading = getattr(ship, 'heading', 511)
@@ -121,35 +130,35 @@ class ProductionAISProtocol:
             heading = 511  # Not available
         else:
             heading = int(heading)  # Ensure integer
-        bits.extend(self._int_to_bits(heading & 0x1FF, 9))
+        fields.append((heading & 0x1FF, 9))
         
         # Time Stamp (6 bits) - seconds in UTC minute
         timestamp = int(time.time()) % 60
-        bits.extend(self._int_to_bits(timestamp & 0x3F, 6))
+        fields.append((timestamp & 0x3F, 6))
         
         # Maneuver Indicator (2 bits) - not available
-        bits.extend(self._int_to_bits(0, 2))
+        fields.append((0, 2))
         
         # Spare (3 bits)
-        bits.extend(self._int_to_bits(0, 3))
+        fields.append((0, 3))
         
         # RAIM Flag (1 bit) - RAIM not in use
-        bits.extend(self._int_to_bits(0, 1))
+        fields.append((0, 1))
         
         # Radio Status (19 bits) - SOTDMA state
-        bits.extend(self._int_to_bits(0, 19))
+        fields.append((0, 19))
         
-        return bits
+        return self._pack_fields(fields)
     
-    def create_complete_frame(self, ship: AISShip) -> List[int]:
-        """Create complete AIS frame from ship object"""
+    def create_complete_frame(self, ship: AISShip) -> np.ndarray:
+        """Create complete AIS frame from ship object as a uint8 bit array"""
         message_bits = self.create_position_message_bits(ship)
         
         # Calculate CRC-16 for the message payload
         crc_bits = self._calculate_crc16(message_bits)
         
         # Combine message + CRC
-        payload_with_crc = message_bits + crc_bits
+        payload_with_crc = np.concatenate([message_bits, crc_bits])
         
         # Apply HDLC bit stuffing to payload
         stuffed_payload = self._hdlc_bit_stuff(payload_with_crc)
@@ -157,76 +166,102 @@ class ProductionAISProtocol:
         # Apply NRZI encoding to stuffed payload
         nrzi_payload = self._nrzi_encode(stuffed_payload)
         
-        # Build frame with training, flags, and processed payload
-        training = [0, 1] * 12  # Training sequence (24 bits)
-        start_delimiter = [0, 1, 1, 1, 1, 1, 1, 0]  # HDLC start flag
-        end_delimiter = [0, 1, 1, 1, 1, 1, 1, 0]    # HDLC end flag
-        buffer_bits = [0] * 8   # Buffer
+        return self._assemble_frame(nrzi_payload)
+    
+    def create_complete_frames(self, ships: List[AISShip]) -> List[np.ndarray]:
+        """Create complete AIS frames for several ships in one batch
         
-        # Combine complete frame
-        complete_frame = training + start_delimiter + nrzi_payload + end_delimiter + buffer_bits
+        Message bits, CRC and NRZI run on 2-D (ship, bit) arrays; only bit
+        stuffing, whose output length differs per message, is done per row.
+        """
+        if not ships:
+            return []
         
-        return complete_frame
-    
-    def _int_to_bits(self, value: int, num_bits: int) -> List[int]:
-        """Convert integer to list of bits (MSB first)"""
-        bits = []
-        for i in range(num_bits - 1, -1, -1):
-            bits.append((value >> i) & 1)
-        return bits
-    
-    def _calculate_crc16(self, data_bits: List[int]) -> List[int]:
-        """Calculate CRC-16-CCITT for AIS message (ITU-R M.1371-5)"""
-        crc = 0xFFFF  # Initial value
+        message_bits = np.stack([self.create_position_message_bits(ship) for ship in ships])
+        crc_bits = self._calculate_crc16_batch(message_bits)
+        payloads = np.concatenate([message_bits, crc_bits], axis=1)
         
-        for bit in data_bits:
-            crc ^= (bit << 15)
-            for _ in range(1):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021  # CCITT polynomial
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
+        stuffed = [self._hdlc_bit_stuff(payload) for payload in payloads]
         
-        # Convert CRC to 16 bits (MSB first)
-        crc_bits = []
-        for i in range(15, -1, -1):
-            crc_bits.append((crc >> i) & 1)
+        # Zero padding past a row's end never affects the NRZI levels before it
+        padded = np.zeros((len(stuffed), max(len(row) for row in stuffed)), dtype=np.uint8)
+        for i, row in enumerate(stuffed):
+            padded[i, :len(row)] = row
+        nrzi = self._nrzi_encode(padded)
         
-        return crc_bits
+        return [self._assemble_frame(nrzi[i, :len(row)]) for i, row in enumerate(stuffed)]
     
-    def _hdlc_bit_stuff(self, bits: List[int]) -> List[int]:
-        """HDLC bit stuffing - insert 0 after five consecutive 1s"""
-        stuffed = []
-        consecutive_ones = 0
+    def _assemble_frame(self, nrzi_payload: np.ndarray) -> np.ndarray:
+        """Fill complete frame in place: training, flags, and processed payload"""
+        sections = (self.TRAINING_SEQUENCE, self.HDLC_FLAG, nrzi_payload,
+                    self.HDLC_FLAG, self.BUFFER_BITS)
+        complete_frame = np.empty(sum(len(section) for section in sections), dtype=np.uint8)
+        offset = 0
+        for section in sections:
+            complete_frame[offset:offset + len(section)] = section
+            offset += len(section)
         
-        for bit in bits:
-            stuffed.append(bit)
-            
-            if bit == 1:
-                consecutive_ones += 1
-                if consecutive_ones == 5:
-                    stuffed.append(0)  # Stuff a zero
-                    consecutive_ones = 0
-            else:
-                consecutive_ones = 0
-        
-        return stuffed
+        return complete_frame
+    
+    def _pack_fields(self, fields: List[Tuple[int, int]]) -> np.ndarray:
+        """Pack (value, width) fields MSB first into a uint8 bit array"""
+        word = 0
+        num_bits = 0
+        for value, width in fields:
+            word = (word << width) | (value & ((1 << width) - 1))
+            num_bits += width
+        
+        # Left-align into whole bytes and let NumPy split them into bits
+        pad = -num_bits % 8
+        packed = np.frombuffer((word << pad).to_bytes((num_bits + pad) // 8, 'big'), dtype=np.uint8)
+        return np.unpackbits(packed)[:num_bits]
+    
+    def _calculate_crc16(self, data_bits: List[int]) -> np.ndarray:
+        """Calculate CRC-16-CCITT for AIS message (ITU-R M.1371-5)"""
+        return calculate_crc(data_bits)
+    
+    def _calculate_crc16_batch(self, data_bits: np.ndarray) -> np.ndarray:
+        """CRC-16-CCITT of every row of a 2-D bit array"""
+        return calculate_crc_batch(data_bits)
     
-    def _nrzi_encode(self, bits: List[int]) -> List[int]:
+    def _hdlc_bit_stuff(self, bits: List[int]) -> np.ndarray:
+        """HDLC bit stuffing - insert 0 after five consecutive 1s"""
+        return hdlc_bit_stuff(bits)
+
+    def _nrzi_encode(self, bits: List[int]) -> np.ndarray:
         """Standard NRZI encoding - transition for 0, no transition for 1"""
-        if not bits:
-            return []
-            
-        encoded = []
-        current = 1  # Start with 1
-        
-        for bit in bits:
-            if bit == 0:
-                current = 1 - current  # Transition
-            encoded.append(current)
-            
-        return encoded
+        return nrzi_encode(bits)
+
+class IQBufferPool:
+    """Small per-thread pool of complex64 IQ buffers reused across modulate() calls"""
+    
+    MIN_POOLED_SAMPLES = 4096  # Tiny buffers are cheaper to allocate than to track
+    
+    def __init__(self, cap: int = 8):
+        self.cap = cap
+        self._local = threading.local()
+    
+    def _queue(self) -> collections.deque:
+        q = getattr(self._local, 'queue', None)
+        if q is None:
+            q = collections.deque(maxlen=self.cap)
+            self._local.queue = q
+        return q
+    
+    def get(self, n: int) -> np.ndarray:
+        """Get a complex64 buffer of length n (contents undefined)"""
+        if n >= self.MIN_POOLED_SAMPLES:
+            q = self._queue()
+            for i, buf in enumerate(q):
+                if len(buf) == n:
+                    del q[i]
+                    return buf
+        return np.empty(n, dtype=np.complex64)
+    
+    def put(self, buf: np.ndarray):
+        """Return a buffer to the pool so a later get() of the same size can reuse it"""
+        if buf.dtype == np.complex64 and buf.ndim == 1 and len(buf) >= self.MIN_POOLED_SAMPLES:
+            self._queue().append(buf)
 
 class ProductionModulator:
     """Production modulator supporting GMSK and rtl_ais optimized FSK"""
@@ -236,29 +271,34 @@ class ProductionModulator:
         self.symbol_rate = symbol_rate
         self.mode = mode
         self.freq_deviation = 2400  # AIS standard FSK deviation
+        self._pool = IQBufferPool()
+        
+        # Sample rate and symbol rate are fixed per instance, so the pulse
+        # shaping filter only needs to be built once
+        self._samples_per_symbol = int(self.sample_rate / self.symbol_rate)
+        self._gaussian_filter = self._build_gaussian_filter()
+        self._ramp_up, self._ramp_down = self._build_ramps()
         
     def modulate(self, bits: List[int]) -> np.ndarray:
-        """Modulate bits to RF signal"""
+        """Modulate bits to RF signal
+        
+        The returned buffer may come from the modulator's pool; pass it to
+        release() once it has been transmitted so the next call can reuse it.
+        """
         if self.mode == OperationMode.RTL_AIS_TESTING:
-            return self._generate_rtl_ais_optimized_fsk(bits)
+            signal = self._generate_rtl_ais_optimized_fsk(bits)
+            signal *= np.float32(0.7)  # rtl_ais receivers do best with a backed-off amplitude
+            return signal
         else:
             return self._generate_production_gmsk(bits)
     
-    def _generate_production_gmsk(self, symbols: List[int]) -> np.ndarray:
-        """Generate production-grade GMSK signal with proper Gaussian filtering"""
-        samples_per_symbol = int(self.sample_rate / self.symbol_rate)
-        
-        # Convert symbols to differential encoding
-        diff_symbols = []
-        for symbol in symbols:
-            diff_symbols.append(2 * symbol - 1)  # Convert 0,1 to -1,1
-        
-        # Upsample to sample rate
-        upsampled = np.zeros(len(diff_symbols) * samples_per_symbol)
-        for i, symbol in enumerate(diff_symbols):
-            upsampled[i * samples_per_symbol] = symbol
-        
-        # Create Gaussian filter (BT = 0.4 for AIS)
+    def release(self, signal: np.ndarray):
+        """Hand a signal returned by modulate() back to the buffer pool"""
+        self._pool.put(signal)
+    
+    def _build_gaussian_filter(self) -> np.ndarray:
+        """Build the normalized Gaussian pulse shaping filter (BT = 0.4 for AIS)"""
+        samples_per_symbol = self._samples_per_symbol
         bt = 0.4
         filter_span = 4  # Filter spans 4 symbol periods
         t = np.arange(-filter_span * samples_per_symbol // 2,
@@ -266,51 +306,65 @@ class ProductionModulator:
         
         # Gaussian filter impulse response
         gaussian_filter = np.exp(-2 * np.pi**2 * bt**2 * self.symbol_rate**2 * t**2 / np.log(2))
-        gaussian_filter = gaussian_filter / np.sum(gaussian_filter)
+        return (gaussian_filter / np.sum(gaussian_filter)).astype(np.float32)
+    
+    def _generate_production_gmsk(self, symbols: List[int]) -> np.ndarray:
+        """Generate production-grade GMSK signal with proper Gaussian filtering"""
+        samples_per_symbol = self._samples_per_symbol
         
-        # Apply Gaussian filter
-        filtered = np.convolve(upsampled, gaussian_filter, mode='same')
+        # Convert symbols to differential encoding (0,1 -> -1,1); cast first
+        # so unsigned frame bits don't wrap
+        diff_symbols = 2 * np.asarray(symbols, dtype=np.float32) - 1
+        
+        # Upsample to sample rate
+        upsampled = np.zeros(len(diff_symbols) * samples_per_symbol, dtype=np.float32)
+        upsampled[::samples_per_symbol] = diff_symbols
         
-        # MSK phase integration
-        phase = np.cumsum(filtered) * np.pi / (2 * samples_per_symbol)
+        # Apply Gaussian filter
+        filtered = np.convolve(upsampled, self._gaussian_filter, mode='same')
         
-        # Generate complex signal
-        signal = np.exp(1j * phase)
+        # MSK phase integration (accumulate in float64 so the phase does not drift)
+        phase = np.cumsum(filtered, dtype=np.float64)
+        phase *= np.pi / (2 * samples_per_symbol)
         
-        return signal.astype(np.complex64)
+        return self._phase_to_iq(phase)
     
     def _generate_rtl_ais_optimized_fsk(self, symbols: List[int]) -> np.ndarray:
         """Generate FSK signal optimized for rtl_ais polar discriminator"""
-        samples_per_symbol = int(self.sample_rate / self.symbol_rate)
-        signal = []
-        phase = 0.0  # Maintain phase continuity (critical for rtl_ais)
-        
-        for symbol in symbols:
-            # AIS standard FSK: Mark (1) = +2400 Hz, Space (0) = -2400 Hz
-            if symbol == 1:
-                freq_offset = +self.freq_deviation
-            else:
-                freq_offset = -self.freq_deviation
-            
-            # Generate samples for this symbol with continuous phase
-            for sample_idx in range(samples_per_symbol):
-                phase_increment = 2 * np.pi * freq_offset / self.sample_rate
-                phase += phase_increment
-                sample = np.exp(1j * phase)
-                signal.append(sample)
+        samples_per_symbol = self._samples_per_symbol
+        
+        # AIS standard FSK: Mark (1) = +2400 Hz, Space (0) = -2400 Hz
+        mark_increment = 2 * np.pi * +self.freq_deviation / self.sample_rate
+        space_increment = 2 * np.pi * -self.freq_deviation / self.sample_rate
+        
+        increments = np.where(np.asarray(symbols) == 1, mark_increment, space_increment)
         
-        return np.array(signal, dtype=np.complex64)
+        # Running sum keeps phase continuous across symbols (critical for rtl_ais)
+        phase = np.cumsum(np.repeat(increments, samples_per_symbol))
+        
+        return self._phase_to_iq(phase)
+    
+    def _phase_to_iq(self, phase: np.ndarray) -> np.ndarray:
+        """Write cos/sin of the phase straight into a pooled complex64 buffer"""
+        phase = phase.astype(np.float32, copy=False)  # single precision trig
+        signal = self._pool.get(len(phase))
+        np.cos(phase, out=signal.real)
+        np.sin(phase, out=signal.imag)
+        return signal
+    
+    def _build_ramps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Build the raised-cosine rise/fall envelopes (1 ms each)"""
+        ramp_samples = int(0.001 * self.sample_rate)  # 1ms ramps
+        t = np.linspace(0, np.pi, ramp_samples, dtype=np.float32)
+        return 0.5 * (1 - np.cos(t)), 0.5 * (1 + np.cos(t))
     
     def add_ramps(self, signal: np.ndarray) -> np.ndarray:
         """Add rise/fall ramps to prevent spectral splatter"""
-        ramp_samples = int(0.001 * self.sample_rate)  # 1ms ramps
+        ramp_samples = len(self._ramp_up)
         
         if len(signal) > 2 * ramp_samples:
-            ramp_up = 0.5 * (1 - np.cos(np.linspace(0, np.pi, ramp_samples)))
-            ramp_down = 0.5 * (1 + np.cos(np.linspace(0, np.pi, ramp_samples)))
-            
-            signal[:ramp_samples] *= ramp_up
-            signal[-ramp_samples:] *= ramp_down
+            signal[:ramp_samples] *= self._ramp_up
+            signal[-ramp_samples:] *= self._ramp_down
             
         return signal
 
@@ -360,8 +414,16 @@ class ProductionSDRInterface:
     AIS_CHANNEL_A = 161975000  # 161.975 MHz
     AIS_CHANNEL_B = 162025000  # 162.025 MHz
     
-    def __init__(self, config: TransmissionConfig):
+    def __init__(self, config: TransmissionConfig, mock: bool = False):
+        """Create the SDR interface
+        
+        Args:
+            config: Transmission configuration
+            mock: If True, only populate frequency/sample rate and never
+                  probe SoapySDR hardware (for tests and CI without an SDR)
+        """
         self.config = config
+        self.mock = mock
         self.sdr = None
         self.tx_stream = None
         self.logger = logging.getLogger(__name__)
@@ -375,7 +437,9 @@ class ProductionSDRInterface:
             self.sample_rate = config.sample_rate
         
         self.sdr_available = False
-        if SOAPY_AVAILABLE:
+        if mock:
+            self.logger.debug("Mock SDR interface, skipping device initialization")
+        elif SOAPY_AVAILABLE:
             try:
                 self._initialize_sdr()
                 self.sdr_available = True
@@ -436,10 +500,6 @@ class ProductionSDRInterface:
         self.logger.info(f"SDR initialized: {self.frequency/1e6:.6f} MHz, "
                        f"{self.sample_rate/1000:.0f} kS/s, {self.config.tx_gain:.1f}dB")
     
-    def is_available(self) -> bool:
-        """Check if SDR is available for transmission"""
-        return self.sdr_available and self.sdr is not None
-    
     def get_device_info(self) -> str:
         """Get information about the SDR device"""
         if not self.is_available():
@@ -488,15 +548,11 @@ class ProductionSDRInterface:
                     self.logger.error(f"Failed to reset and setup stream: {reset_error}")
                     return False
             
-            # Apply mode-specific signal conditioning
-            if self.config.mode == OperationMode.RTL_AIS_TESTING:
-                signal = signal * 0.7  # Optimize amplitude for rtl_ais
-            
             # Activate stream and transmit
             self.sdr.activateStream(stream)
             time.sleep(0.01)  # Brief settle time
             
-            result = self.sdr.writeStream(stream, [signal], len(signal))
+            written = write_stream_samples(self.sdr, stream, signal)
             
             # Cleanup stream properly
             time.sleep(0.01)
@@ -504,11 +560,11 @@ class ProductionSDRInterface:
             self.sdr.closeStream(stream)
             self.tx_stream = None
             
-            success = result.ret == len(signal)
+            success = written == len(signal)
             if success:
                 self.logger.debug(f"Transmitted {len(signal)} samples successfully")
             else:
-                self.logger.warning(f"Transmission incomplete: {result.ret}/{len(signal)}")
+                self.logger.warning(f"Transmission incomplete: {written}/{len(signal)}")
             
             return success
             
@@ -578,6 +634,10 @@ class ProductionAISTransmitter:
         self.sdr = ProductionSDRInterface(self.config)
         self.modulator = ProductionModulator(self.sdr.sample_rate, mode=self.config.mode)
         
+        # Single worker so modulating the next ship overlaps the current TX
+        self._prep_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ais-modulate")
+        
         # SOTDMA controller (only for production mode)
         self.sotdma_controllers = {}  # One per MMSI
         
@@ -590,13 +650,34 @@ class ProductionAISTransmitter:
     
     def transmit_ship(self, ship: AISShip) -> bool:
         """Transmit AIS message for a single ship"""
+        return self._run_transmission(ship, lambda: self._prepare_signal(ship),
+                                      self.modulator.release)
+    
+    def _prepare_signal(self, ship: AISShip) -> Optional[np.ndarray]:
+        """Build, verify and modulate the frame for a ship (None if the frame is invalid)"""
+        # Create AIS frame
+        frame = self.protocol.create_complete_frame(ship)
+        
+        # Verify frame structure
+        if not self._verify_frame(frame):
+            self.logger.error(f"Invalid frame for ship {ship.name} (MMSI: {ship.mmsi})")
+            return None
+        
+        # Modulate signal
+        signal = self.modulator.modulate(frame)
+        return self.modulator.add_ramps(signal)
+    
+    def _run_transmission(self, ship: AISShip, prepare: Callable[[], Optional[np.ndarray]],
+                          release: Callable[[np.ndarray], None],
+                          before_transmit: Optional[Callable[[], None]] = None) -> bool:
+        """Wait for the ship's slot and transmit the signal returned by prepare()
+        
+        before_transmit, if given, runs after the slot wait and just before
+        the signal goes on air.
+        """
         try:
-            # Create AIS frame
-            frame = self.protocol.create_complete_frame(ship)
-            
-            # Verify frame structure
-            if not self._verify_frame(frame):
-                self.logger.error(f"Invalid frame for ship {ship.name} (MMSI: {ship.mmsi})")
+            signal = prepare()
+            if signal is None:
                 return False
             
             # SOTDMA timing for production mode
@@ -613,12 +694,14 @@ class ProductionAISTransmitter:
                 if sleep_time > 0 and sleep_time < 60:  # Reasonable wait time
                     time.sleep(sleep_time)
             
-            # Modulate signal
-            signal = self.modulator.modulate(frame)
-            signal = self.modulator.add_ramps(signal)
+            if before_transmit:
+                before_transmit()
             
-            # Transmit
-            success = self.sdr.transmit_signal(signal)
+            # Transmit, then recycle the IQ buffer for the next slot
+            try:
+                success = self.sdr.transmit_signal(signal)
+            finally:
+                release(signal)
             
             if success:
                 self.packets_sent += 1
@@ -634,12 +717,30 @@ class ProductionAISTransmitter:
             return False
     
     def transmit_ships(self, ships: List[AISShip], status_callback: Optional[Callable] = None) -> int:
-        """Transmit AIS messages for multiple ships"""
+        """Transmit AIS messages for multiple ships
+        
+        The next ship's signal is modulated on a worker thread while the
+        current one is on air. It is only queued once the current ship's
+        slot wait is over, so its timestamp and position are not captured
+        a whole slot early. Buffers are released back on that same thread
+        so its pool keeps recycling them.
+        """
         success_count = 0
+        pending = {}  # Ship index -> future of its prepared signal
+        
+        def prefetch(index: int):
+            if index < len(ships) and index not in pending:
+                pending[index] = self._submit(self._prepare_signal, ships[index])
+        
+        def release(signal: np.ndarray):
+            self._submit(self.modulator.release, signal)
         
-        for ship in ships:
+        for index, ship in enumerate(ships):
             try:
-                if self.transmit_ship(ship):
+                prefetch(index)
+                current = pending.pop(index)
+                if self._run_transmission(ship, current.result, release,
+                                          lambda: prefetch(index + 1)):
                     success_count += 1
                     if status_callback:
                         status_callback(f"Transmitted: {ship.name} (MMSI: {ship.mmsi})")
@@ -657,6 +758,18 @@ class ProductionAISTransmitter:
         
         return success_count
     
+    def _submit(self, fn: Callable, *args) -> concurrent.futures.Future:
+        """Run fn on the prep worker, or inline once close() has shut it down"""
+        try:
+            return self._prep_executor.submit(fn, *args)
+        except RuntimeError:
+            future = concurrent.futures.Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+    
     def start_continuous_transmission(self, ships: List[AISShip], 
                                     status_callback: Optional[Callable] = None):
         """Start continuous transmission for multiple ships"""
@@ -703,19 +816,17 @@ class ProductionAISTransmitter:
             self.transmission_thread.join(timeout=5)
         self.logger.info("Stopped AIS transmission")
     
-    def _verify_frame(self, frame: List[int]) -> bool:
+    def _verify_frame(self, frame: np.ndarray) -> bool:
         """Verify AIS frame structure"""
         if len(frame) < 40:
             return False
         
         # Verify training sequence
-        training_check = ''.join(map(str, frame[:24]))
-        if training_check != "010101010101010101010101":
+        if not np.array_equal(frame[:24], ProductionAISProtocol.TRAINING_SEQUENCE):
             return False
         
         # Verify start flag
-        start_flag_check = ''.join(map(str, frame[24:32]))
-        if start_flag_check != "01111110":
+        if not np.array_equal(frame[24:32], ProductionAISProtocol.HDLC_FLAG):
             return False
         
         return True
@@ -737,6 +848,7 @@ class ProductionAISTransmitter:
     def close(self):
         """Clean shutdown"""
         self.stop_transmission()
+        self._prep_executor.shutdown(wait=False)
         self.sdr.close()
         self.logger.info("Production AIS Transmitter closed")
     
@@ -6,6 +6,7 @@ Contains transmission logic and device management from the original implementati
 """
 
 import time
+import logging
 import numpy as np
 from ..signal.modulation import create_ais_signal
 from ..protocol.ais_encoding import char_to_sixbit
@@ -18,12 +19,33 @@ try:
 except ImportError:
     SDR_AVAILABLE = False
 
+logger = logging.getLogger(__name__)
+
+def write_stream_samples(sdr, stream, signal):
+    """Write the whole signal in stream-MTU sized slices, returning samples written
+    
+    A single writeStream call only accepts up to the driver's MTU, so keep
+    feeding views of the remaining samples until all are consumed or the
+    driver reports an error.
+    """
+    mtu = sdr.getStreamMTU(stream) or len(signal)
+    written = 0
+    while written < len(signal):
+        chunk = signal[written:written + mtu]
+        result = sdr.writeStream(stream, [chunk], len(chunk))
+        if result.ret <= 0:
+            logger.warning("writeStream returned %s", result.ret)
+            break
+        written += result.ret
+    return written
+
 class TransmissionController:
     """Controls SDR transmission operations"""
     
     def __init__(self):
         self.sdr = None
         self.tx_stream = None
+        self.verbose = False  # Per-bit and signal/gain debug output
         
     def is_available(self):
         """Check if SDR transmission is available"""
@@ -38,33 +60,35 @@ class TransmissionController:
             return False
         
         def update_status(msg):
-            print(msg)
+            logger.info("%s", msg)
             if status_callback:
                 status_callback(msg)
         
         try:
-            # Add detailed logging of the exact message being transmitted
+            # Add detailed logging of the exact message being transmitted,
+            # collected and emitted as a single status update
             if nmea_sentence:
-                update_status("=" * 50)
-                update_status(f"TRANSMITTING EXACT SENTENCE: {nmea_sentence}")
+                log = ["=" * 50, f"TRANSMITTING EXACT SENTENCE: {nmea_sentence}"]
                 
                 # Log binary representation too
                 if "AIVDM" in nmea_sentence:
                     parts = nmea_sentence.split(',')
                     if len(parts) >= 6:
                         payload = parts[5]
-                        update_status(f"Payload: {payload}")
+                        log.append(f"Payload: {payload}")
                         
                         # Show each character and its 6-bit representation
-                        bits_log = "Bit representation: "
-                        for char in payload:
-                            try:
-                                bits = char_to_sixbit(char)
-                                bits_log += f"[{char}:{bits}] "
-                            except ValueError as e:
-                                bits_log += f"[{char}:ERROR] "
-                        update_status(bits_log)
-                update_status("=" * 50)
+                        if self.verbose:
+                            char_logs = []
+                            for char in payload:
+                                try:
+                                    bits = char_to_sixbit(char)
+                                    char_logs.append(f"[{char}:{bits}]")
+                                except ValueError as e:
+                                    char_logs.append(f"[{char}:ERROR]")
+                            log.append("Bit representation: " + " ".join(char_logs))
+                log.append("=" * 50)
+                update_status("\n".join(log))
             
             update_status(f"Preparing to transmit {signal_preset['name']}...")
             
@@ -87,8 +111,10 @@ class TransmissionController:
                 update_status("Error: No valid signal to transmit")
                 return False
             
-            # Debug signal stats
-            print(f"Signal stats: min={np.min(np.abs(signal)):.3f}, max={np.max(np.abs(signal)):.3f}, len={len(signal)}")
+            # Debug signal stats (single magnitude pass for both extremes)
+            if self.verbose:
+                magnitude = np.abs(signal)
+                logger.info("Signal stats: min=%.3f, max=%.3f, len=%d", magnitude.min(), magnitude.max(), len(signal))
             
             # Setup transmission stream
             update_status("Setting up transmission stream...")
@@ -97,12 +123,16 @@ class TransmissionController:
             
             # Transmit
             update_status("Transmitting signal...")
-            status = self.sdr.writeStream(self.tx_stream, [signal], len(signal))
-            update_status(f"Transmission status: {status}")
+            written = write_stream_samples(self.sdr, self.tx_stream, signal)
+            update_status(f"Transmission status: {written}/{len(signal)} samples written")
             
             # Cleanup
             self._cleanup_transmission(update_status)
             
+            if written < len(signal):
+                update_status(f"Transmission incomplete: {written}/{len(signal)} samples written")
+                return False
+            
             update_status(f"Successfully transmitted on {signal_preset['freq']/1e6} MHz")
             return True
             
@@ -185,24 +215,28 @@ If problems persist, try restarting your computer.
         # Set gain - handle different SDR types
         try:
             gain_names = self.sdr.listGains(SOAPY_SDR_TX, 0)
-            print(f"Available gain elements: {gain_names}")
+            if self.verbose:
+                logger.info("Available gain elements: %s", gain_names)
             
             # Try individual gain elements
             if 'AMP' in gain_names:
                 amp_value = 14 if tx_gain > 30 else 0
                 self.sdr.setGain(SOAPY_SDR_TX, 0, 'AMP', amp_value)
-                print(f"Set AMP gain to {amp_value}")
+                if self.verbose:
+                    logger.info("Set AMP gain to %s", amp_value)
                 
             if 'VGA' in gain_names:
                 vga_value = min(47, max(0, tx_gain))
                 self.sdr.setGain(SOAPY_SDR_TX, 0, 'VGA', vga_value)
-                print(f"Set VGA gain to {vga_value}")
+                if self.verbose:
+                    logger.info("Set VGA gain to %s", vga_value)
                 
         except Exception as e:
             # Fallback to overall gain
-            print(f"Could not set individual gains: {e}")
+            logger.warning("Could not set individual gains: %s", e)
             self.sdr.setGain(SOAPY_SDR_TX, 0, tx_gain)
-            print(f"Set overall gain to {tx_gain}")
+            if self.verbose:
+                logger.info("Set overall gain to %s", tx_gain)
         
         # Try setting bandwidth if supported
         try:
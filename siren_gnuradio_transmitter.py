@@ -201,7 +201,7 @@ class SIRENAISMessageSender:
                     
                     # Simple 6-bit ASCII to binary conversion (basic fallback)
                     # Note: This is a simplified version - SIREN has the complete implementation
-                    bit_string = ""
+                    chunks = []
                     for char in payload:
                         val = ord(char)
                         if val >= 48 and val < 88:
@@ -212,8 +212,8 @@ class SIRENAISMessageSender:
                             continue  # Skip invalid characters
                         
                         # Convert to 6 bits
-                        for i in range(5, -1, -1):
-                            bit_string += str((val >> i) & 1)
+                        chunks.append(format(val & 0x3F, '06b'))
+                    bit_string = ''.join(chunks)
                     
                     # Send raw binary bit string
                     self.ws.send(bit_string)
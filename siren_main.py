@@ -20,12 +20,17 @@ while providing a much more maintainable modular structure.
 
 import sys
 import os
+import logging
 
 # Add the ais_main package to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'ais_main'))
 
 def main():
     """Main entry point for the application"""
+    # Status updates from simulation and transmission go through logging
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     print("=" * 60)
     print("SIREN Generator & Transmitter - Modular Version")
     print("@ Peyton Andras @ Louisiana State University 2025")
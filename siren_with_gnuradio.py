@@ -10,12 +10,17 @@ GNU Radio method into the SIREN project.
 
 import sys
 import os
+import logging
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def main():
     """Launch SIREN with GNU Radio integration"""
+    # Status updates from simulation and transmission go through logging
+    logging.basicConfig(level=logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    
     print("🚢 SIREN: Spoofed Identification & Real-time Emulation Node")
     print("📡 GNU Radio Integration Active")
     print("=" * 60)